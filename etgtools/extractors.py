@@ -386,7 +386,10 @@ class FunctionDef(BaseDef, FixWxPrefix):
         """
         Returns True if there are any overloads that are not ignored.
         """
-        return bool([x for x in self.overloads if not x.ignored])
+        for x in self.overloads:
+            if not x.ignored:
+                return True
+        return False
 
 
     def renameOverload(self, matchText, newName, **kw):
@@ -1356,7 +1359,10 @@ class PyFunctionDef(BaseDef):
         """
         Returns True if there are any overloads that are not ignored.
         """
-        return bool([x for x in self.overloads if not x.ignored])
+        for x in self.overloads:
+            if not x.ignored:
+                return True
+        return False
 
 
 
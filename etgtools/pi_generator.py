@@ -22,9 +22,10 @@ want to add some type info to that version of the file eventually...
 """
 
 import sys, os, re
+import io
 import etgtools.extractors as extractors
 import etgtools.generators as generators
-from etgtools.generators import nci, Utf8EncodingStream, textfile_open
+from etgtools.generators import nci, textfile_open
 from etgtools.tweaker_tools import FixWxPrefix, magicMethods, \
                                    guessTypeInt, guessTypeFloat, guessTypeStr
 
@@ -79,6 +80,25 @@ header_pyi = """\
 
 #---------------------------------------------------------------------------
 
+# The lines marking the beginning and end of each module's section in the
+# .pi and .pyi files. The section name is substituted for the %s.
+sectionBeginMarkerFmt = '#-- begin-%s --#'
+sectionEndMarkerFmt = '#-- end-%s --#'
+
+# Translation tables for removing several characters from type strings in a
+# single step.
+_templateStripTable = str.maketrans('', '', '> ')
+_varTypeStripTable = str.maketrans('', '', '*& ')
+
+# The placeholder values to use for global variables, paired with the
+# functions that check if a variable is of that kind, in the order to try them.
+_globalVarValues = ( (guessTypeInt,   '0'),
+                     (guessTypeFloat, '0.0'),
+                     (guessTypeStr,   '""'),
+                     )
+
+#---------------------------------------------------------------------------
+
 def piIgnored(obj):
     return getattr(obj, 'piIgnored', False)
 
@@ -86,11 +106,32 @@ def piIgnored(obj):
 
 class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
 
+    def __init__(self):
+        super(PiWrapperGenerator, self).__init__()
+        # The contents of the destination files are kept here so multiple
+        # sections can be written to a file without having to reread and
+        # rewrite the whole file each time. The files are written to disk,
+        # and the cache emptied, by flush(). What was originally read from
+        # each file is kept too, so unchanged files can be left alone.
+        self._fileCache = dict()
+        self._fileOriginals = dict()
+        self._fixWxPrefixCache = dict()
+        self._nciCache = dict()
+
+
     def generate(self, module, destFile=None):
-        stream = Utf8EncodingStream()
+        if SKIP_PI_FILE and SKIP_PYI_FILE:
+            # Nothing would be written, so don't bother generating anything.
+            # Still reorder the items like generateModule would, in case the
+            # generators that follow depend on it.
+            self.moveOrderedPyCode(module)
+            return
+
+        stream = io.StringIO()
 
         # process the module object and its child objects
         self.generateModule(module, stream)
+        text = stream.getvalue()
 
         # Write the contents of the stream to the destination file
         if not destFile:
@@ -103,52 +144,109 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
         destFile_pyi = destFile + '.pyi'
 
         def _checkAndWriteHeader(destFile, header, docstring):
-            if not os.path.exists(destFile):
-                # create the file and write the header
-                with textfile_open(destFile, 'wt') as f:
-                    f.write(header)
-                    if docstring:
-                        f.write('\n"""\n%s"""\n' % docstring)
+            if destFile not in self._fileCache and not os.path.exists(destFile):
+                # start the file with the header, it will be written to disk
+                # along with the sections by flush()
+                if docstring:
+                    header += '\n"""\n%s"""\n' % docstring
+                self._fileCache[destFile] = header
 
         if not SKIP_PI_FILE:
             _checkAndWriteHeader(destFile_pi, header_pi, module.docstring)
-            self.writeSection(destFile_pi, module.name, stream.getvalue())
+            self.writeSection(destFile_pi, module.name, text)
 
         if not SKIP_PYI_FILE:
             _checkAndWriteHeader(destFile_pyi, header_pyi, module.docstring)
-            self.writeSection(destFile_pyi, module.name, stream.getvalue())
+            self.writeSection(destFile_pyi, module.name, text)
+
+        self.flush()
 
 
     def writeSection(self, destFile, sectionName, sectionText):
         """
-        Read all the lines from destFile, remove those currently between
-        begin/end markers for sectionName (if any), and write the lines back
-        to the file with the new text in sectionText.
+        Remove the lines currently between begin/end markers for sectionName
+        (if any) in destFile, and replace them with the new text in
+        sectionText. The change is made to the cached copy of the file, use
+        flush() to write it to disk.
         """
-        sectionBeginLine = -1
-        sectionEndLine = -1
-        sectionBeginMarker = '#-- begin-%s --#' % sectionName
-        sectionEndMarker = '#-- end-%s --#' % sectionName
-
-        with textfile_open(destFile, 'rt') as fid:
-            lines = fid.readlines()
-        for idx, line in enumerate(lines):
-            if line.startswith(sectionBeginMarker):
-                sectionBeginLine = idx
-            if line.startswith(sectionEndMarker):
-                sectionEndLine = idx
-
-        if sectionBeginLine == -1:
-            # not there already, add to the end
-            lines.append(sectionBeginMarker + '\n')
-            lines.append(sectionText)
-            lines.append(sectionEndMarker + '\n')
-        else:
-            # replace the existing lines
-            lines[sectionBeginLine+1:sectionEndLine] = [sectionText]
+        data = self._fileCache.get(destFile)
+        if data is None:
+            with textfile_open(destFile, 'rt') as fid:
+                data = fid.read()
+            self._fileOriginals[destFile] = data
+        self._fileCache[destFile] = self._applySection(data, sectionName, sectionText)
+
+
+    def _applySection(self, data, sectionName, sectionText):
+        """
+        Replace or append the section named sectionName in the file contents
+        in data, and return the new contents.
+        """
+        sectionBeginMarker = sectionBeginMarkerFmt % sectionName
+        sectionEndMarker = sectionEndMarkerFmt % sectionName
 
-        with textfile_open(destFile, 'wt') as f:
-            f.writelines(lines)
+        # The markers are searched for with their preceding newline so only
+        # whole lines are matched.
+        if data.startswith(sectionBeginMarker):
+            begin = 0
+        else:
+            begin = data.find('\n' + sectionBeginMarker)
+            if begin == -1:
+                # not there already, add to the end
+                return ''.join([data,
+                                sectionBeginMarker, '\n',
+                                sectionText,
+                                sectionEndMarker, '\n'])
+            begin += 1
+
+        end = data.find('\n' + sectionEndMarker, begin)
+        if end == -1:
+            raise RuntimeError("Section marker '%s' found without a matching '%s'"
+                               % (sectionBeginMarker, sectionEndMarker))
+
+        # replace the existing lines, from the one following the begin marker
+        # up to the end marker line
+        begin = data.find('\n', begin) + 1
+        return data[:begin] + sectionText + data[end+1:]
+
+
+    def flush(self):
+        """
+        Write the files that have been changed by writeSection to disk.
+        Files whose contents are the same as before are not rewritten, so
+        their timestamps don't trigger needless rebuilds of later steps.
+        """
+        for destFile, data in sorted(self._fileCache.items()):
+            if data == self._fileOriginals.get(destFile):
+                continue
+            with textfile_open(destFile, 'wt') as f:
+                f.write(data)
+        self._fileCache.clear()
+        self._fileOriginals.clear()
+
+    def fixWxPrefix(self, name, checkIsCore=False):
+        # The same type and base class names are fixed over and over again,
+        # and the result only depends on the args and self.isCore, so the
+        # results are remembered until the next module is started.
+        key = (name, checkIsCore)
+        try:
+            return self._fixWxPrefixCache[key]
+        except KeyError:
+            value = FixWxPrefix.fixWxPrefix(self, name, checkIsCore)
+            self._fixWxPrefixCache[key] = value
+            return value
+
+    def _nci(self, text, numSpaces):
+        # The same docstrings can be written more than once at the same
+        # indent level within a module, so remember the reindented versions
+        # until the next module is started.
+        key = (text, numSpaces)
+        try:
+            return self._nciCache[key]
+        except KeyError:
+            value = nci(text, numSpaces)
+            self._nciCache[key] = value
+            return value
 
     #-----------------------------------------------------------------------
     def generateModule(self, module, stream):
@@ -156,24 +254,22 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
         Generate code for each of the top-level items in the module.
         """
         assert isinstance(module, extractors.ModuleDef)
+        # The generated code is collected as a list of strings and written to
+        # the stream all at once when we're done.
+        out = list()
+        emit = out.append
         self.isCore = module.module == '_core'
+        self._fixWxPrefixCache.clear()
+        self._nciCache.clear()
 
         for item in module.imports:
             if item.startswith('_'):
                 item = item[1:]
             if item == 'core':
                 continue
-            stream.write('import wx.%s\n' % item)
+            emit(f'import wx.{item}\n')
 
-        # Move all PyCode items with an order value to the beginning of the
-        # list as they most likely should appear before everything else.
-        pycode = list()
-        for item in module:
-            if isinstance(item, extractors.PyCodeDef) and item.order is not None:
-                pycode.append(item)
-        for item in pycode:
-            module.items.remove(item)
-        module.items = pycode + module.items
+        self.moveOrderedPyCode(module)
 
         methodMap = {
             extractors.ClassDef         : self.generateClass,
@@ -194,57 +290,73 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
             if item.ignored or piIgnored(item):
                 continue
             function = methodMap[item.__class__]
-            function(item, stream)
+            function(item, out)
+
+        stream.write(''.join(out))
+
+
+    def moveOrderedPyCode(self, module):
+        """
+        Move all PyCode items with an order value to the beginning of the
+        list as they most likely should appear before everything else.
+        """
+        pycode = list()
+        others = list()
+        for item in module:
+            if isinstance(item, extractors.PyCodeDef) and item.order is not None:
+                pycode.append(item)
+            else:
+                others.append(item)
+        module.items = pycode + others
 
 
     #-----------------------------------------------------------------------
-    def generateEnum(self, enum, stream, indent=''):
+    def generateEnum(self, enum, out, indent=''):
         assert isinstance(enum, extractors.EnumDef)
+        emit = out.append
         if enum.ignored or piIgnored(enum):
             return
         for v in enum.items:
             if v.ignored or piIgnored(v):
                 continue
             name = v.pyName or v.name
-            stream.write('%s%s = 0\n' % (indent, name))
+            emit(f'{indent}{name} = 0\n')
 
     #-----------------------------------------------------------------------
-    def generateGlobalVar(self, globalVar, stream):
+    def generateGlobalVar(self, globalVar, out):
         assert isinstance(globalVar, extractors.GlobalVarDef)
         if globalVar.ignored or piIgnored(globalVar):
             return
         name = globalVar.pyName or globalVar.name
-        if guessTypeInt(globalVar):
-            valTyp = '0'
-        elif guessTypeFloat(globalVar):
-            valTyp = '0.0'
-        elif guessTypeStr(globalVar):
-            valTyp = '""'
+        for guess, value in _globalVarValues:
+            if guess(globalVar):
+                valTyp = value
+                break
         else:
             valTyp = globalVar.type
-            valTyp = valTyp.replace('const ', '')
-            valTyp = valTyp.replace('*', '')
-            valTyp = valTyp.replace('&', '')
-            valTyp = valTyp.replace(' ', '')
+            if 'const ' in valTyp:
+                valTyp = valTyp.replace('const ', '')
+            valTyp = valTyp.translate(_varTypeStripTable)
             valTyp = self.fixWxPrefix(valTyp)
             valTyp += '()'
 
-        stream.write('%s = %s\n' % (name, valTyp))
+        out.append(f'{name} = {valTyp}\n')
 
     #-----------------------------------------------------------------------
-    def generateDefine(self, define, stream):
+    def generateDefine(self, define, out):
         assert isinstance(define, extractors.DefineDef)
         if define.ignored or piIgnored(define):
             return
         # we're assuming that all #defines that are not ignored are integer or string values
         if '"' in define.value:
-            stream.write('%s = ""\n' % (define.pyName or define.name))
+            out.append(f'{define.pyName or define.name} = ""\n')
         else:
-            stream.write('%s = 0\n' % (define.pyName or define.name))
+            out.append(f'{define.pyName or define.name} = 0\n')
 
     #-----------------------------------------------------------------------
-    def generateTypedef(self, typedef, stream, indent=''):
+    def generateTypedef(self, typedef, out, indent=''):
         assert isinstance(typedef, extractors.TypedefDef)
+        emit = out.append
         if typedef.ignored or piIgnored(typedef):
             return
 
@@ -257,77 +369,79 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
         # Otherwise write a mock class for it that combines the template and class.
         # First, extract the info we need.
         if typedef.docAsClass:
-            bases = [self.fixWxPrefix(b, True) for b in typedef.bases]
+            bases = self.fixWxPrefixMany(typedef.bases, True)
             name = self.fixWxPrefix(typedef.name)
 
         elif '<' in typedef.type and '>' in typedef.type:
-            t = typedef.type.replace('>', '')
-            t = t.replace(' ', '')
+            t = typedef.type.translate(_templateStripTable)
             bases = t.split('<')
-            bases = [self.fixWxPrefix(b, True) for b in bases]
+            bases = self.fixWxPrefixMany(bases, True)
             name = self.fixWxPrefix(typedef.name)
 
         # Now write the Python equivalent class for the typedef
         if not bases:
             bases = ['object']  # this should not happen, but just in case...
-        stream.write('%sclass %s(%s):\n' % (indent, name, ', '.join(bases)))
+        emit(f'{indent}class {name}({", ".join(bases)}):\n')
         indent2 = indent + ' '*4
         if typedef.briefDoc:
-            stream.write('%s"""\n' % indent2)
-            stream.write(nci(typedef.briefDoc, len(indent2)))
-            stream.write('%s"""\n' % indent2)
+            emit(f'{indent2}"""\n')
+            emit(self._nci(typedef.briefDoc, len(indent2)))
+            emit(f'{indent2}"""\n')
         else:
-            stream.write('%spass\n\n' % indent2)
+            emit(f'{indent2}pass\n\n')
 
 
     #-----------------------------------------------------------------------
-    def generateWigCode(self, wig, stream, indent=''):
+    def generateWigCode(self, wig, out, indent=''):
         assert isinstance(wig, extractors.WigCode)
         # write nothing for this one
 
 
     #-----------------------------------------------------------------------
-    def generatePyCode(self, pc, stream, indent=''):
+    def generatePyCode(self, pc, out, indent=''):
         assert isinstance(pc, extractors.PyCodeDef)
+        emit = out.append
         code = pc.code
         if hasattr(pc, 'klass'):
             code = code.replace(pc.klass.pyName+'.', '')
-        stream.write('\n')
-        stream.write(nci(code, len(indent)))
+        emit('\n')
+        emit(self._nci(code, len(indent)))
 
     #-----------------------------------------------------------------------
-    def generatePyFunction(self, pf, stream, indent=''):
+    def generatePyFunction(self, pf, out, indent=''):
         assert isinstance(pf, extractors.PyFunctionDef)
-        stream.write('\n')
+        emit = out.append
+        emit('\n')
         if pf.deprecated:
-            stream.write('%s@wx.deprecated\n' % indent)
+            emit(f'{indent}@wx.deprecated\n')
         if pf.isStatic:
-            stream.write('%s@staticmethod\n' % indent)
-        stream.write('%sdef %s%s:\n' % (indent, pf.name, pf.argsString))
+            emit(f'{indent}@staticmethod\n')
+        emit(f'{indent}def {pf.name}{pf.argsString}:\n')
         indent2 = indent + ' '*4
         if pf.briefDoc:
-            stream.write('%s"""\n' % indent2)
-            stream.write(nci(pf.briefDoc, len(indent2)))
-            stream.write('%s"""\n' % indent2)
-        stream.write('%spass\n' % indent2)
+            emit(f'{indent2}"""\n')
+            emit(self._nci(pf.briefDoc, len(indent2)))
+            emit(f'{indent2}"""\n')
+        emit(f'{indent2}pass\n')
 
     #-----------------------------------------------------------------------
-    def generatePyClass(self, pc, stream, indent=''):
+    def generatePyClass(self, pc, out, indent=''):
         assert isinstance(pc, extractors.PyClassDef)
+        emit = out.append
 
         # write the class declaration and docstring
         if pc.deprecated:
-            stream.write('%s@wx.deprecated\n' % indent)
-        stream.write('%sclass %s' % (indent, pc.name))
+            emit(f'{indent}@wx.deprecated\n')
+        emit(f'{indent}class {pc.name}')
         if pc.bases:
-            stream.write('(%s):\n' % ', '.join(pc.bases))
+            emit(f'({", ".join(pc.bases)}):\n')
         else:
-            stream.write('(object):\n')
+            emit('(object):\n')
         indent2 = indent + ' '*4
         if pc.briefDoc:
-            stream.write('%s"""\n' % indent2)
-            stream.write(nci(pc.briefDoc, len(indent2)))
-            stream.write('%s"""\n' % indent2)
+            emit(f'{indent2}"""\n')
+            emit(self._nci(pc.briefDoc, len(indent2)))
+            emit(f'{indent2}"""\n')
 
         # these are the only kinds of items allowed to be items in a PyClass
         dispatch = {
@@ -339,18 +453,19 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
         for item in pc.items:
             item.klass = pc
             f = dispatch[item.__class__]
-            f(item, stream, indent2)
+            f(item, out, indent2)
 
 
 
     #-----------------------------------------------------------------------
-    def generateFunction(self, function, stream):
+    def generateFunction(self, function, out):
         assert isinstance(function, extractors.FunctionDef)
+        emit = out.append
         if not function.pyName:
             return
-        stream.write('\ndef %s' % function.pyName)
+        emit(f'\ndef {function.pyName}')
         if function.hasOverloads():
-            stream.write('(*args, **kw)')
+            emit('(*args, **kw)')
         else:
             argsString = function.pyArgsString
             if not argsString:
@@ -362,35 +477,36 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
                 pos = argsString.find('(')
                 argsString = argsString[pos:]
             argsString = argsString.replace('::', '.')
-            stream.write(argsString)
-        stream.write(':\n')
-        stream.write('    """\n')
-        stream.write(nci(function.pyDocstring, 4))
-        stream.write('    """\n')
-
-
-    def generateParameters(self, parameters, stream, indent):
-        def _lastParameter(idx):
-            if idx == len(parameters)-1:
-                return True
-            for i in range(idx+1, len(parameters)):
-                if not (parameters[i].ignored or piIgnored(parameters[i])):
-                    return False
-            return True
+            emit(argsString)
+        emit(':\n')
+        emit('    """\n')
+        emit(self._nci(function.pyDocstring, 4))
+        emit('    """\n')
+
+
+    def generateParameters(self, parameters, out, indent):
+        emit = out.append
+        # find the last parameter that will be written, so we know when to
+        # stop adding commas
+        lastIdx = -1
+        for idx, param in enumerate(parameters):
+            if not (param.ignored or piIgnored(param)):
+                lastIdx = idx
 
         for idx, param in enumerate(parameters):
             if param.ignored or piIgnored(param):
                 continue
-            stream.write(param.name)
+            emit(param.name)
             if param.default:
-                stream.write('=%s' % param.default)
-            if not _lastParameter(idx):
-                stream.write(', ')
+                emit(f'={param.default}')
+            if idx != lastIdx:
+                emit(', ')
 
 
     #-----------------------------------------------------------------------
-    def generateClass(self, klass, stream, indent=''):
+    def generateClass(self, klass, out, indent=''):
         assert isinstance(klass, extractors.ClassDef)
+        emit = out.append
         if klass.ignored or piIgnored(klass):
             return
 
@@ -407,36 +523,37 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
 
         # write class declaration
         klassName = klass.pyName or klass.name
-        stream.write('\n%sclass %s' % (indent, klassName))
         if bases:
-            stream.write('(')
-            bases = [self.fixWxPrefix(b, True) for b in bases]
-            stream.write(', '.join(bases))
-            stream.write(')')
+            bases = self.fixWxPrefixMany(bases, True)
         else:
-            stream.write('(object)')
-        stream.write(':\n')
+            bases = ['object']
+        emit(f'\n{indent}class {klassName}({", ".join(bases)}):\n')
         indent2 = indent + ' '*4
 
         # docstring
-        stream.write('%s"""\n' % indent2)
-        stream.write(nci(klass.pyDocstring, len(indent2)))
-        stream.write('%s"""\n' % indent2)
+        emit(f'{indent2}"""\n')
+        emit(self._nci(klass.pyDocstring, len(indent2)))
+        emit(f'{indent2}"""\n')
 
         # generate nested classes
         for item in klass.innerclasses:
-            self.generateClass(item, stream, indent2)
+            self.generateClass(item, out, indent2)
 
         # Split the items into public and protected groups
-        enums = [i for i in klass if
-                     isinstance(i, extractors.EnumDef) and
-                     i.protection == 'public']
-        ctors = [i for i in klass if
-                     isinstance(i, extractors.MethodDef) and
-                     i.protection == 'public' and (i.isCtor or i.isDtor)]
-        public = [i for i in klass if i.protection == 'public' and
-                     i not in ctors and i not in enums]
-        protected = [i for i in klass if i.protection == 'protected']
+        enums = list()
+        ctors = list()
+        public = list()
+        protected = list()
+        for i in klass:
+            if i.protection == 'public':
+                if isinstance(i, extractors.EnumDef):
+                    enums.append(i)
+                elif isinstance(i, extractors.MethodDef) and (i.isCtor or i.isDtor):
+                    ctors.append(i)
+                else:
+                    public.append(i)
+            elif i.protection == 'protected':
+                protected.append(i)
 
         dispatch = {
             extractors.MemberVarDef     : self.generateMemberVar,
@@ -454,56 +571,59 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
 
         for item in enums:
             item.klass = klass
-            self.generateEnum(item, stream, indent2)
+            self.generateEnum(item, out, indent2)
 
         for item in ctors:
             if item.isCtor:
                 item.klass = klass
-                self.generateMethod(item, stream, indent2,
+                self.generateMethod(item, out, indent2,
                                     name='__init__', docstring=klass.pyDocstring)
 
         for item in public:
             item.klass = klass
             f = dispatch[item.__class__]
-            f(item, stream, indent2)
+            f(item, out, indent2)
 
         for item in protected:
             item.klass = klass
             f = dispatch[item.__class__]
-            f(item, stream, indent2)
+            f(item, out, indent2)
 
-        stream.write('%s# end of class %s\n\n' % (indent, klassName))
+        emit(f'{indent}# end of class {klassName}\n\n')
 
 
-    def generateMemberVar(self, memberVar, stream, indent):
+    def generateMemberVar(self, memberVar, out, indent):
         assert isinstance(memberVar, extractors.MemberVarDef)
         if memberVar.ignored or piIgnored(memberVar):
             return
-        stream.write('%s%s = property(None, None)\n' % (indent, memberVar.name))
+        out.append(f'{indent}{memberVar.name} = property(None, None)\n')
 
 
-    def generateProperty(self, prop, stream, indent):
+    def generateProperty(self, prop, out, indent):
         assert isinstance(prop, extractors.PropertyDef)
         if prop.ignored or piIgnored(prop):
             return
-        stream.write('%s%s = property(None, None)\n' % (indent, prop.name))
+        out.append(f'{indent}{prop.name} = property(None, None)\n')
 
 
-    def generatePyProperty(self, prop, stream, indent):
+    def generatePyProperty(self, prop, out, indent):
         assert isinstance(prop, extractors.PyPropertyDef)
         if prop.ignored or piIgnored(prop):
             return
-        stream.write('%s%s = property(None, None)\n' % (indent, prop.name))
+        out.append(f'{indent}{prop.name} = property(None, None)\n')
 
 
-    def generateMethod(self, method, stream, indent, name=None, docstring=None):
+    def generateMethod(self, method, out, indent, name=None, docstring=None):
         assert isinstance(method, extractors.MethodDef)
-        for m in method.all():  # use the first not ignored if there are overloads
-            if not m.ignored or piIgnored(m):
-                method = m
-                break
-        else:
-            return
+        emit = out.append
+        if method.ignored and not piIgnored(method):
+            # use the first not ignored if there are overloads
+            for m in method.overloads:
+                if not m.ignored or piIgnored(m):
+                    method = m
+                    break
+            else:
+                return
         if method.isDtor:
             return
 
@@ -513,13 +633,13 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
 
         # write the method declaration
         if method.isStatic:
-            stream.write('\n%s@staticmethod' % indent)
-        stream.write('\n%sdef %s' % (indent, name))
+            emit(f'\n{indent}@staticmethod')
+        emit(f'\n{indent}def {name}')
         if method.hasOverloads():
             if not method.isStatic:
-                stream.write('(self, *args, **kw)')
+                emit('(self, *args, **kw)')
             else:
-                stream.write('(*args, **kw)')
+                emit('(*args, **kw)')
         else:
             argsString = method.pyArgsString
             if not argsString:
@@ -536,8 +656,8 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
                 else:
                     argsString = '(self, ' + argsString[1:]
             argsString = argsString.replace('::', '.')
-            stream.write(argsString)
-        stream.write(':\n')
+            emit(argsString)
+        emit(':\n')
         indent2 = indent + ' '*4
 
         # docstring
@@ -546,37 +666,38 @@ class PiWrapperGenerator(generators.WrapperGeneratorBase, FixWxPrefix):
                 docstring = method.pyDocstring
             else:
                 docstring = ""
-        stream.write('%s"""\n' % indent2)
+        emit(f'{indent2}"""\n')
         if docstring.strip():
-            stream.write(nci(docstring, len(indent2)))
-        stream.write('%s"""\n' % indent2)
+            emit(self._nci(docstring, len(indent2)))
+        emit(f'{indent2}"""\n')
 
 
 
-    def generateCppMethod(self, method, stream, indent=''):
+    def generateCppMethod(self, method, out, indent=''):
         assert isinstance(method, extractors.CppMethodDef)
-        self.generateMethod(method, stream, indent)
+        self.generateMethod(method, out, indent)
 
 
-    def generateCppMethod_sip(self, method, stream, indent=''):
+    def generateCppMethod_sip(self, method, out, indent=''):
         assert isinstance(method, extractors.CppMethodDef_sip)
-        self.generateMethod(method, stream, indent)
+        self.generateMethod(method, out, indent)
 
 
-    def generatePyMethod(self, pm, stream, indent):
+    def generatePyMethod(self, pm, out, indent):
         assert isinstance(pm, extractors.PyMethodDef)
+        emit = out.append
         if pm.ignored or piIgnored(pm):
             return
         if pm.isStatic:
-            stream.write('\n%s@staticmethod' % indent)
-        stream.write('\n%sdef %s' % (indent, pm.name))
-        stream.write(getattr(pm, 'piArgsString', pm.argsString))
-        stream.write(':\n')
+            emit(f'\n{indent}@staticmethod')
+        emit(f'\n{indent}def {pm.name}')
+        emit(getattr(pm, 'piArgsString', pm.argsString))
+        emit(':\n')
         indent2 = indent + ' '*4
 
-        stream.write('%s"""\n' % indent2)
-        stream.write(nci(pm.pyDocstring, len(indent2)))
-        stream.write('%s"""\n' % indent2)
+        emit(f'{indent2}"""\n')
+        emit(self._nci(pm.pyDocstring, len(indent2)))
+        emit(f'{indent2}"""\n')
 
 
 
@@ -104,6 +104,13 @@ class FixWxPrefix(object):
         else:
             return name
 
+    def fixWxPrefixMany(self, names, checkIsCore=False):
+        """
+        Like fixWxPrefix, but for a sequence of names. A list of the fixed
+        names is returned.
+        """
+        return [self.fixWxPrefix(name, checkIsCore) for name in names]
+
     def _getCoreTopLevelNames(self):
         # Since the real wx.core module may not exist yet, and since actually
         # executing code at this point is probably a bad idea, try parsing the
@@ -133,7 +140,8 @@ class FixWxPrefix(object):
         for item in parseTree.body:
             _processItem(item, names)
 
-        FixWxPrefix._coreTopLevelNames = names
+        # a set, since this is used for frequent membership tests
+        FixWxPrefix._coreTopLevelNames = set(names)
 
 
 